@@ -0,0 +1,77 @@
+"""
+Benchmark for incremental NIC validation
+Compares a plain full pass with IncrementalNICValidator re-runs
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from nic_validator import NICValidator, IncrementalNICValidator
+
+
+def make_registry(count, seed=0):
+    """Generate old format NICs with random year, day count and serial"""
+    rng = random.Random(seed)
+    return [
+        f"{rng.randint(0, 99):02d}{rng.randint(1, 866):03d}{rng.randint(0, 9999):04d}V"
+        for _ in range(count)
+    ]
+
+
+def timed(function):
+    """Run function and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    registry = make_registry(count)
+    changed = registry[:]
+    for i in range(0, count, 100):  # 1% of rows changed
+        changed[i] = changed[i][:-1] + "X"
+
+    print("\n" + "="*80)
+    print(f"INCREMENTAL VALIDATION BENCHMARK ({count} NICs)")
+    print("="*80)
+
+    validator = NICValidator()
+    _, plain = timed(lambda: [validator.validate(nic) for nic in registry])
+    print(f"Plain full pass:              {plain:8.3f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "results.db")
+
+        def run(nics):
+            with IncrementalNICValidator(db_path) as store:
+                return list(store.validate_changed(nics))
+
+        def read_all(details):
+            with IncrementalNICValidator(db_path) as store:
+                return list(store.iter_results(details))
+
+        # Each timing includes opening the store (fingerprint + known set load)
+        _, first = timed(lambda: run(registry))
+        print(f"Incremental first run:        {first:8.3f}s")
+
+        _, rerun = timed(lambda: run(registry))
+        print(f"Incremental unchanged re-run: {rerun:8.3f}s ({plain/rerun:.1f}x plain speed)")
+
+        _, delta = timed(lambda: run(changed))
+        print(f"Incremental 1% changed:       {delta:8.3f}s ({plain/delta:.1f}x plain speed)")
+
+        _, read = timed(lambda: read_all(False))
+        print(f"Read all stored verdicts:     {read:8.3f}s ({plain/read:.1f}x plain speed)")
+
+        _, read = timed(lambda: read_all(True))
+        print(f"Read all verdicts + details:  {read:8.3f}s ({plain/read:.1f}x plain speed)")
+
+    print("="*80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
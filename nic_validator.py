@@ -23,6 +23,14 @@ Days Encoding:
 - Female: Days + 500 (501-866)
 """
 
+import hashlib
+import inspect
+import json
+import sqlite3
+
+# Bump when the validation rules change in a way the bytecode hash cannot see
+RULES_VERSION = "1"
+
 class NICValidator:
     def __init__(self):
         """Initialize the NIC Validator DFA"""
@@ -318,6 +326,192 @@ class NICValidator:
             return False, message, self.validation_details
 
 
+def _hash_code(digest, code):
+    """Feed a code object's bytecode, constants and names into digest"""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            _hash_code(digest, const)
+        elif isinstance(const, frozenset):
+            # Set literals: repr order depends on the hash seed
+            digest.update(repr(sorted(map(repr, const))).encode())
+        else:
+            digest.update(repr(const).encode())
+
+
+def rules_fingerprint(validator_class=None):
+    """
+    Fingerprint of the validation rules: RULES_VERSION plus the bytecode of
+    every method, classmethod and staticmethod of the validator class
+    (including inherited ones).
+    Bytecode is always available, unlike source, so pyc-only deployments
+    still detect rule changes; a Python upgrade also changes the fingerprint.
+    Module-level helpers and constants the rules call are not hashed, so
+    changing them requires a RULES_VERSION bump.
+    """
+    validator_class = validator_class or NICValidator
+    methods = {}
+    for klass in validator_class.__mro__:
+        for name, member in vars(klass).items():
+            if isinstance(member, (classmethod, staticmethod)):
+                member = member.__func__
+            if name not in methods and inspect.isfunction(member):
+                methods[name] = member
+
+    digest = hashlib.sha256(RULES_VERSION.encode())
+    for name in sorted(methods):
+        digest.update(name.encode())
+        _hash_code(digest, methods[name].__code__)
+    return digest.hexdigest()
+
+
+class IncrementalNICValidator:
+    """
+    Wraps NICValidator with an on-disk SQLite result store so that re-runs
+    over a mostly unchanged registry only validate new or changed NICs.
+
+    Results are keyed by the normalized NIC and the rules fingerprint, so a
+    rules change makes every stored result stale and forces re-validation.
+    The NICs already stored under the current fingerprint are loaded into
+    an in-memory set once, so skipping an unchanged NIC costs a set lookup
+    rather than a database query. validate_changed() yields only the delta;
+    callers that need a verdict for every row read the stored ones in bulk
+    with iter_results().
+    """
+
+    def __init__(self, db_path, validator=None, chunk_size=10000):
+        """Open (or create) the result store at db_path"""
+        self.validator = validator or NICValidator()
+        self.fingerprint = rules_fingerprint(type(self.validator))
+        self.chunk_size = chunk_size
+        self.validated = 0
+        self.skipped = 0
+        self.pending = []
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " nic TEXT NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " is_valid INTEGER NOT NULL,"
+            " message TEXT NOT NULL,"
+            " details TEXT NOT NULL,"
+            " PRIMARY KEY (nic, fingerprint))"
+        )
+        self.connection.commit()
+        self.known = {
+            row[0] for row in self.connection.execute(
+                "SELECT nic FROM results WHERE fingerprint = ?", (self.fingerprint,)
+            )
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def normalize(nic):
+        """Normalize a NIC the same way NICValidator.validate does"""
+        return nic.strip().upper()
+
+    def validate_changed(self, nics):
+        """
+        Validate only the NICs without a stored result under the current
+        rules, skipping unchanged ones. New results are flushed to disk every
+        chunk_size NICs, so an interrupted run keeps most of its work.
+        Yields: (nic, is_valid, message, details) for each newly validated NIC
+        """
+        known = self.known
+        normalize = self.normalize
+        validate = self.validator.validate
+        try:
+            for nic in nics:
+                key = normalize(nic)
+                if key in known:
+                    self.skipped += 1
+                    continue
+                is_valid, message, details = validate(key)
+                self.validated += 1
+                known.add(key)
+                self.pending.append((key, is_valid, message, details))
+                if len(self.pending) >= self.chunk_size:
+                    self.flush()
+                yield key, is_valid, message, details
+        finally:
+            self.flush()
+
+    def flush(self):
+        """Write pending results to the store in a single transaction"""
+        if not self.pending:
+            return
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO results"
+            " (nic, fingerprint, is_valid, message, details)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (nic, self.fingerprint, int(is_valid), message, json.dumps(details))
+                for nic, is_valid, message, details in self.pending
+            ],
+        )
+        self.connection.commit()
+        self.pending = []
+
+    def iter_results(self, details=True):
+        """
+        Stream every result stored under the current rules with one query.
+        Decoding the details dict costs about as much as re-validating, so
+        pass details=False when only the verdict and message are needed.
+        Yields: (nic, is_valid, message, details) or (nic, is_valid, message)
+        """
+        self.flush()
+        if not details:
+            rows = self.connection.execute(
+                "SELECT nic, is_valid, message FROM results WHERE fingerprint = ?",
+                (self.fingerprint,),
+            )
+            for nic, is_valid, message in rows:
+                yield nic, bool(is_valid), message
+            return
+
+        rows = self.connection.execute(
+            "SELECT nic, is_valid, message, details FROM results"
+            " WHERE fingerprint = ?",
+            (self.fingerprint,),
+        )
+        for nic, is_valid, message, details in rows:
+            yield nic, bool(is_valid), message, json.loads(details)
+
+    def lookup(self, nic):
+        """
+        Fetch the stored result for a NIC under the current rules
+        Returns: (is_valid, message, details) or None if not stored
+        """
+        self.flush()
+        row = self.connection.execute(
+            "SELECT is_valid, message, details FROM results"
+            " WHERE nic = ? AND fingerprint = ?",
+            (self.normalize(nic), self.fingerprint),
+        ).fetchone()
+        if row is None:
+            return None
+        return bool(row[0]), row[1], json.loads(row[2])
+
+    def prune(self):
+        """Delete results stored under other rules fingerprints"""
+        cursor = self.connection.execute(
+            "DELETE FROM results WHERE fingerprint != ?", (self.fingerprint,)
+        )
+        self.connection.commit()
+        return cursor.rowcount
+
+    def close(self):
+        """Flush pending results and close the result store"""
+        self.flush()
+        self.connection.close()
+
+
 def print_state_diagram():
     """Print ASCII representation of the state diagram"""
     print("\n" + "="*80)
@@ -3,8 +3,11 @@ Comprehensive Test Suite for Sri Lankan NIC Validator
 Tests various edge cases and real-world scenarios
 """
 
+import os
 import sys
-from nic_validator import NICValidator
+import tempfile
+import nic_validator
+from nic_validator import NICValidator, IncrementalNICValidator
 
 
 class TestNICValidator:
@@ -43,6 +46,136 @@ class TestNICValidator:
                       f"Day: {details.get('day_of_year', 'N/A')}")
         print()
     
+    def check(self, condition, description):
+        """Record a single boolean check"""
+        self.total_tests += 1
+        status = "✓" if condition else "✗"
+        print(f"{status} Test {self.total_tests:3d}: {description}")
+        if condition:
+            self.passed_tests += 1
+        else:
+            self.failed_tests += 1
+        print()
+    
+    def run_incremental_tests(self):
+        """Test the persistent result store used for incremental re-runs"""
+        registry = ["901234567V", "885501234V", "199001012345", "999991234V", "12345"]
+        
+        class CountingValidator(NICValidator):
+            calls = 0
+            
+            def validate(self, nic):
+                CountingValidator.calls += 1
+                return super().validate(nic)
+        
+        class StrictValidator(NICValidator):
+            def validate_semantic_rules(self):
+                return False, "Rejected by stricter rules"
+        
+        class ResetValidator(NICValidator):
+            def reset(self):
+                super().reset()
+                self.current_state = 'q1'
+        
+        class FlakyValidator(NICValidator):
+            fail = True
+            
+            def validate(self, nic):
+                if FlakyValidator.fail:
+                    raise RuntimeError("validator failure")
+                return super().validate(nic)
+        
+        class RuleOneValidator(NICValidator):
+            @classmethod
+            def rule(cls):
+                return 1
+        
+        class RuleTwoValidator(NICValidator):
+            @classmethod
+            def rule(cls):
+                return 2
+        
+        # Rules fingerprint
+        fingerprint = nic_validator.rules_fingerprint()
+        self.check(fingerprint == nic_validator.rules_fingerprint(NICValidator),
+                   "Fingerprint is stable for unchanged rules")
+        self.check(nic_validator.rules_fingerprint(StrictValidator) != fingerprint,
+                   "Overriding validate_semantic_rules changes the fingerprint")
+        self.check(nic_validator.rules_fingerprint(ResetValidator) != fingerprint,
+                   "Overriding reset changes the fingerprint")
+        self.check(nic_validator.rules_fingerprint(RuleOneValidator)
+                   != nic_validator.rules_fingerprint(RuleTwoValidator),
+                   "Classmethod bodies are part of the fingerprint")
+        original_version = nic_validator.RULES_VERSION
+        nic_validator.RULES_VERSION = original_version + "-changed"
+        try:
+            self.check(nic_validator.rules_fingerprint() != fingerprint,
+                       "Bumping RULES_VERSION changes the fingerprint")
+        finally:
+            nic_validator.RULES_VERSION = original_version
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "results.db")
+            
+            with IncrementalNICValidator(db_path, CountingValidator()) as first:
+                first_results = list(first.validate_changed(registry))
+            self.check(CountingValidator.calls == len(registry),
+                       "First run validates every NIC")
+            self.check([r[1] for r in first_results] == [True, True, True, False, False],
+                       "Incremental results match expected validity")
+            
+            CountingValidator.calls = 0
+            with IncrementalNICValidator(db_path, CountingValidator()) as second:
+                second_results = list(second.validate_changed(registry + [" 198856712345 "]))
+                self.check(CountingValidator.calls == 1 and second.skipped == len(registry),
+                           "Re-run only validates the new NIC")
+                self.check([r[0] for r in second_results] == ["198856712345"],
+                           "Re-run yields only the new NIC, normalized")
+                self.check(second.lookup(" 901234567v ") == first_results[0][1:],
+                           "Stored result equals the freshly computed result")
+                stored = {r[0]: r[1:] for r in second.iter_results()}
+                self.check(len(stored) == len(registry) + 1
+                           and all(stored[r[0]] == r[1:] for r in first_results),
+                           "Bulk read returns every stored result")
+                self.check(sorted(second.iter_results(details=False))
+                           == sorted((nic,) + result[:2] for nic, result in stored.items()),
+                           "Bulk read without details returns every verdict")
+            
+            with IncrementalNICValidator(db_path, StrictValidator()) as strict:
+                strict_results = list(strict.validate_changed(registry))
+                self.check(len(strict_results) == len(registry)
+                           and not any(r[1] for r in strict_results),
+                           "Rules change forces re-validation")
+                self.check(strict.prune() == len(registry) + 1,
+                           "Prune removes results from other fingerprints")
+            
+            # Failed validation is retried, not silently skipped
+            flaky_path = os.path.join(tmp, "flaky.db")
+            with IncrementalNICValidator(flaky_path, FlakyValidator()) as flaky:
+                try:
+                    list(flaky.validate_changed(["901234567V"]))
+                except RuntimeError:
+                    pass
+                FlakyValidator.fail = False
+                retried = list(flaky.validate_changed(["901234567V"]))
+                self.check(len(retried) == 1 and flaky.lookup("901234567V") is not None,
+                           "NIC whose validation raised is validated on retry")
+            
+            # Interrupted run keeps the NICs validated so far
+            interrupted_path = os.path.join(tmp, "interrupted.db")
+            store = IncrementalNICValidator(interrupted_path, chunk_size=2)
+            run = store.validate_changed(registry)
+            for _ in range(3):
+                next(run)
+            with IncrementalNICValidator(interrupted_path) as reader:
+                self.check(len(list(reader.iter_results())) == 2,
+                           "Results are flushed to disk in chunks during a run")
+            run.close()
+            store.close()
+            with IncrementalNICValidator(interrupted_path) as resumed:
+                self.check(len(list(resumed.iter_results())) == 3,
+                           "Interrupted run keeps results validated before the interruption")
+    
     def run_all_tests(self):
         """Run comprehensive test suite"""
         print("\n" + "="*100)
@@ -156,6 +289,12 @@ class TestNICValidator:
         self.test_case("190000012345", False, "New format - day 000")
         self.test_case("190036712345", False, "New format - day 367 (invalid)")
         
+        # Category 11: Incremental Validation
+        print("="*100)
+        print("CATEGORY 11: INCREMENTAL VALIDATION RESULT STORE")
+        print("="*100)
+        self.run_incremental_tests()
+        
         # Print summary
         print("\n" + "="*100)
         print("TEST SUMMARY")